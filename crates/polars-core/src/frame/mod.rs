@@ -441,7 +441,11 @@ impl DataFrame {
     /// This may lead to more peak memory consumption.
     pub fn as_single_chunk_par(&mut self) -> &mut Self {
         if self.columns.iter().any(|s| s.n_chunks() > 1) {
-            self.columns = self.apply_columns_par(&|s| s.rechunk());
+            // Move the columns into the closure so that the chunks of every column
+            // are freed as soon as that column is rechunked, instead of keeping all
+            // original chunks alive until the whole DataFrame is rechunked.
+            let columns = mem::take(&mut self.columns);
+            self.columns = POOL.install(|| columns.into_par_iter().map(|s| s.rechunk()).collect());
         }
         self
     }
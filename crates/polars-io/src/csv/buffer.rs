@@ -632,7 +632,9 @@ impl<'a> Buffer<'a> {
                 v.data.shrink_to_fit();
 
                 let mut valid_utf8 = true;
-                if delay_utf8_validation(v.encoding, v.ignore_errors) {
+                // Pure ASCII data is valid utf8 and every offset is a char boundary,
+                // so the full validation below can be skipped.
+                if delay_utf8_validation(v.encoding, v.ignore_errors) && !v.data.is_ascii() {
                     // Check if the whole buffer is utf8. This alone is not enough,
                     // we must also check byte starts, see: https://github.com/jorgecarleitao/arrow2/pull/823
                     simdutf8::basic::from_utf8(&v.data)
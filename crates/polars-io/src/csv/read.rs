@@ -391,6 +391,10 @@ impl<'a, R: MmapBytesReader + 'a> CsvReader<'a, R> {
         'a: 'b,
     {
         let reader_bytes = get_reader_bytes(&mut self.reader)?;
+        // chunks are parsed in parallel, but each one is scanned sequentially,
+        // so readahead within every chunk still pays off
+        #[cfg(feature = "csv")]
+        reader_bytes.advise_sequential();
         CoreReader::new(
             reader_bytes,
             self.n_rows,
@@ -1,3 +1,29 @@
+/// Find the first separator or eol char outside of quotes in a field that starts
+/// with a quote char.
+///
+/// There can be pair of double-quotes within string.
+/// Each of the embedded double-quote characters must be represented
+/// by a pair of double-quote characters:
+/// e.g. 1997,Ford,E350,"Super, ""luxurious"" truck",20020
+///
+/// Instead of toggling a quote state on every byte, we jump to the closing quote
+/// and from there to the next separator, eol or (re)opening quote with `memchr`.
+#[inline]
+fn find_quoted_field_end(v: &[u8], separator: u8, quote_char: u8, eol_char: u8) -> Option<usize> {
+    debug_assert_eq!(v.first(), Some(&quote_char));
+    let mut idx = 1;
+    loop {
+        // closing quote
+        idx += memchr::memchr(quote_char, &v[idx..])? + 1;
+        idx += memchr::memchr3(separator, eol_char, quote_char, &v[idx..])?;
+        if v[idx] != quote_char {
+            return Some(idx);
+        }
+        // the string field is opened again
+        idx += 1;
+    }
+}
+
 #[cfg(not(feature = "simd"))]
 mod inner {
     /// An adapted version of std::iter::Split.
@@ -42,10 +68,6 @@ mod inner {
             self.finished = true;
             Some((self.v, need_escaping))
         }
-
-        fn eof_oel(&self, current_ch: u8) -> bool {
-            current_ch == self.separator || current_ch == self.eol_char
-        }
     }
 
     impl<'a> Iterator for SplitFields<'a> {
@@ -66,47 +88,26 @@ mod inner {
             // we have checked bounds
             let pos = if self.quoting && unsafe { *self.v.get_unchecked(0) } == self.quote_char {
                 needs_escaping = true;
-                // There can be pair of double-quotes within string.
-                // Each of the embedded double-quote characters must be represented
-                // by a pair of double-quote characters:
-                // e.g. 1997,Ford,E350,"Super, ""luxurious"" truck",20020
-
-                // denotes if we are in a string field, started with a quote
-                let mut in_field = false;
-
-                let mut idx = 0u32;
-                let mut current_idx = 0u32;
-                // micro optimizations
-                #[allow(clippy::explicit_counter_loop)]
-                for &c in self.v.iter() {
-                    if c == self.quote_char {
-                        // toggle between string field enclosure
-                        //      if we encounter a starting '"' -> in_field = true;
-                        //      if we encounter a closing '"' -> in_field = false;
-                        in_field = !in_field;
-                    }
-
-                    if !in_field && self.eof_oel(c) {
-                        if c == self.eol_char {
-                            // safety
-                            // we are in bounds
-                            return unsafe {
-                                self.finish_eol(needs_escaping, current_idx as usize)
-                            };
+                match super::find_quoted_field_end(
+                    self.v,
+                    self.separator,
+                    self.quote_char,
+                    self.eol_char,
+                ) {
+                    None => return self.finish(needs_escaping),
+                    Some(idx) => unsafe {
+                        // Safety:
+                        // idx was just found
+                        if *self.v.get_unchecked(idx) == self.eol_char {
+                            return self.finish_eol(needs_escaping, idx);
+                        } else {
+                            idx
                         }
-                        idx = current_idx;
-                        break;
-                    }
-                    current_idx += 1;
-                }
-
-                if idx == 0 {
-                    return self.finish(needs_escaping);
+                    },
                 }
-
-                idx as usize
             } else {
-                match self.v.iter().position(|&c| self.eof_oel(c)) {
+                // memchr scans word-at-a-time (SWAR) even on targets without SIMD
+                match memchr::memchr2(self.separator, self.eol_char, self.v) {
                     None => return self.finish(needs_escaping),
                     Some(idx) => unsafe {
                         // Safety:
@@ -143,16 +144,6 @@ mod inner {
     const SIMD_SIZE: usize = 16;
     type SimdVec = u8x16;
 
-    #[inline]
-    unsafe fn simple_argmax(arr: &[bool; SIMD_SIZE]) -> usize {
-        for (i, item) in arr.iter().enumerate() {
-            if *item {
-                return i;
-            }
-        }
-        unreachable!();
-    }
-
     /// An adapted version of std::iter::Split.
     /// This exists solely because we cannot split the lines naively as
     pub(crate) struct SplitFields<'a> {
@@ -226,45 +217,23 @@ mod inner {
             // we have checked bounds
             let pos = if self.quoting && unsafe { *self.v.get_unchecked(0) } == self.quote_char {
                 needs_escaping = true;
-                // There can be pair of double-quotes within string.
-                // Each of the embedded double-quote characters must be represented
-                // by a pair of double-quote characters:
-                // e.g. 1997,Ford,E350,"Super, ""luxurious"" truck",20020
-
-                // denotes if we are in a string field, started with a quote
-                let mut in_field = false;
-
-                let mut idx = 0u32;
-                let mut current_idx = 0u32;
-                // micro optimizations
-                #[allow(clippy::explicit_counter_loop)]
-                for &c in self.v.iter() {
-                    if c == self.quote_char {
-                        // toggle between string field enclosure
-                        //      if we encounter a starting '"' -> in_field = true;
-                        //      if we encounter a closing '"' -> in_field = false;
-                        in_field = !in_field;
-                    }
-
-                    if !in_field && self.eof_oel(c) {
-                        if c == self.eol_char {
-                            // safety
-                            // we are in bounds
-                            return unsafe {
-                                self.finish_eol(needs_escaping, current_idx as usize)
-                            };
+                match super::find_quoted_field_end(
+                    self.v,
+                    self.separator,
+                    self.quote_char,
+                    self.eol_char,
+                ) {
+                    None => return self.finish(needs_escaping),
+                    Some(idx) => unsafe {
+                        // Safety:
+                        // idx was just found
+                        if *self.v.get_unchecked(idx) == self.eol_char {
+                            return self.finish_eol(needs_escaping, idx);
+                        } else {
+                            idx
                         }
-                        idx = current_idx;
-                        break;
-                    }
-                    current_idx += 1;
-                }
-
-                if idx == 0 {
-                    return self.finish(needs_escaping);
+                    },
                 }
-
-                idx as usize
             } else {
                 let mut total_idx = 0;
 
@@ -280,14 +249,10 @@ mod inner {
                             let simd_bytes = SimdVec::from(lane);
                             let has_eol_char = simd_bytes.simd_eq(self.simd_eol_char);
                             let has_separator = simd_bytes.simd_eq(self.simd_separator);
-                            let has_any = has_separator.bitor(has_eol_char);
-                            if has_any.any() {
-                                // soundness we can transmute because we have the same alignment
-                                let has_any = std::mem::transmute::<
-                                    Mask<_, SIMD_SIZE>,
-                                    [bool; SIMD_SIZE],
-                                >(has_any);
-                                total_idx += simple_argmax(&has_any);
+                            let has_any = has_separator.bitor(has_eol_char).to_bitmask();
+                            if has_any != 0 {
+                                // the lowest set bit is the first matching byte
+                                total_idx += has_any.trailing_zeros() as usize;
                                 break;
                             } else {
                                 total_idx += SIMD_SIZE;
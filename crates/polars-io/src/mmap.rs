@@ -61,6 +61,20 @@ pub enum ReaderBytes<'a> {
     Mapped(memmap::Mmap, &'a File),
 }
 
+impl ReaderBytes<'_> {
+    /// Hint the kernel to read ahead aggressively if the bytes are memory-mapped.
+    ///
+    /// Only use this for readers that consume the whole mapping front to back.
+    #[cfg(feature = "csv")]
+    pub(crate) fn advise_sequential(&self) {
+        #[cfg(target_family = "unix")]
+        if let Self::Mapped(mmap, _) = self {
+            // This is only a hint; ignore failures.
+            let _ = mmap.advise(memmap::Advice::Sequential);
+        }
+    }
+}
+
 impl std::ops::Deref for ReaderBytes<'_> {
     type Target = [u8];
     fn deref(&self) -> &[u8] {
@@ -37,7 +37,6 @@ impl CsvExec {
             .low_memory(self.options.low_memory)
             .with_null_values(std::mem::take(&mut self.options.null_values))
             .with_predicate(predicate)
-            .with_encoding(CsvEncoding::LossyUtf8)
             ._with_comment_prefix(std::mem::take(&mut self.options.comment_prefix))
             .with_quote_char(self.options.quote_char)
             .with_end_of_line_char(self.options.eol_char)
@@ -61,7 +61,7 @@ from polars.exceptions import (
 )
 from polars.functions import col, lit
 from polars.io._utils import _is_glob_pattern, _is_local_file
-from polars.io.csv._utils import _check_arg_is_1byte
+from polars.io.csv._utils import _check_arg_is_1byte, _update_columns
 from polars.io.spreadsheet._write_utils import (
     _unpack_multi_column_dict,
     _xl_apply_conditional_formats,
@@ -99,7 +99,6 @@ from polars.utils.deprecation import (
 )
 from polars.utils.various import (
     _prepare_row_count_args,
-    _process_null_values,
     _warn_null_comparison,
     can_create_dicts_with_pyarrow,
     handle_projection_columns,
@@ -692,6 +691,7 @@ class DataFrame:
         eol_char: str = "\n",
         raise_if_empty: bool = True,
         truncate_ragged_lines: bool = False,
+        new_columns: Sequence[str] | None = None,
     ) -> DataFrame:
         """
         Read a CSV file into a DataFrame.
@@ -729,8 +729,6 @@ class DataFrame:
                     f"`dtypes` should be of type list or dict, got {type(dtypes).__name__!r}"
                 )
 
-        processed_null_values = _process_null_values(null_values)
-
         if isinstance(columns, str):
             columns = [columns]
         if isinstance(source, str) and _is_glob_pattern(source):
@@ -768,14 +766,15 @@ class DataFrame:
                 truncate_ragged_lines=truncate_ragged_lines,
             )
             if columns is None:
-                return scan.collect()
+                df = scan.collect()
             elif is_str_sequence(columns, allow_str=False):
-                return scan.select(columns).collect()
+                df = scan.select(columns).collect()
             else:
                 raise ValueError(
                     "cannot use glob patterns and integer based projection as `columns` argument"
                     "\n\nUse columns: List[str]"
                 )
+            return _update_columns(df, new_columns) if new_columns else df
 
         projection, columns = handle_projection_columns(columns)
 
@@ -799,7 +798,7 @@ class DataFrame:
             low_memory,
             comment_prefix,
             quote_char,
-            processed_null_values,
+            null_values,
             missing_utf8_is_empty_string,
             try_parse_dates,
             skip_rows_after_header,
@@ -809,6 +808,7 @@ class DataFrame:
             raise_if_empty=raise_if_empty,
             truncate_ragged_lines=truncate_ragged_lines,
             schema=schema,
+            new_columns=new_columns,
         )
         return self
 
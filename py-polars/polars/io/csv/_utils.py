@@ -1,16 +1,25 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Sequence
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Iterable, Mapping, Sequence
+
+from polars.datatypes import Utf8
 
 if TYPE_CHECKING:
+    from types import ModuleType
+
     from polars import DataFrame
+    from polars.type_aliases import PolarsDataType
 
 
 def _check_arg_is_1byte(
     arg_name: str, arg: str | None, *, can_be_empty: bool = False
 ) -> None:
     if isinstance(arg, str):
-        arg_byte_length = len(arg.encode("utf-8"))
+        # ascii strings (the common case) have as many bytes as characters,
+        # so only encode when that does not hold
+        arg_byte_length = len(arg) if arg.isascii() else len(arg.encode("utf-8"))
         if can_be_empty:
             if arg_byte_length > 1:
                 raise ValueError(
@@ -24,6 +33,73 @@ def _check_arg_is_1byte(
             )
 
 
+@lru_cache(maxsize=128)
+def _check_csv_separators(
+    separator: str, quote_char: str | None, eol_char: str
+) -> None:
+    # Cached on the (rarely changing) argument values, so repeated reads with the
+    # same dialect skip validation; invalid values raise, and are not cached.
+    _check_arg_is_1byte("separator", separator, can_be_empty=False)
+    _check_arg_is_1byte("quote_char", quote_char, can_be_empty=True)
+    _check_arg_is_1byte("eol_char", eol_char, can_be_empty=False)
+
+
+@lru_cache(maxsize=None)
+def _pyarrow_csv() -> ModuleType:
+    """Import `pyarrow.csv` once, on first use of the pyarrow CSV reader."""
+    import pyarrow.csv
+
+    return pyarrow.csv
+
+
+@lru_cache(maxsize=None)
+def _interned_names(prefix: str, start: int) -> tuple[str, ...]:
+    return tuple(sys.intern(f"{prefix}{idx}") for idx in range(start, start + 1024))
+
+
+def _generated_names(
+    prefix: str, start: int, column_indices: Iterable[int]
+) -> list[str]:
+    names = _interned_names(prefix, start)
+    n_names = len(names)
+    return [
+        names[idx] if 0 <= idx < n_names else f"{prefix}{idx + start}"
+        for idx in column_indices
+    ]
+
+
+def _autogenerated_column_names(column_indices: Iterable[int]) -> list[str]:
+    """Get the autogenerated `column_x` names for the given (zero-based) indices."""
+    return _generated_names("column_", 1, column_indices)
+
+
+def _pyarrow_column_names(column_indices: Iterable[int]) -> list[str]:
+    """Get the `fx` names pyarrow autogenerates for the given (zero-based) indices."""
+    return _generated_names("f", 0, column_indices)
+
+
+@lru_cache(maxsize=64)
+def _rename_prefix_fn(
+    new_columns: tuple[str, ...],
+) -> Callable[[list[str]], list[str]]:
+    """
+    Get a `with_column_names` function that renames the first columns.
+
+    Cached, so that scanning many files with the same `new_columns` shares one
+    function object instead of creating a closure per call.
+    """
+    names = list(new_columns)
+    n_names = len(names)
+
+    def with_column_names(cols: list[str]) -> list[str]:
+        out = names.copy()
+        if len(cols) > n_names:
+            out.extend(cols[n_names:])
+        return out
+
+    return with_column_names
+
+
 def _update_columns(df: DataFrame, new_columns: Sequence[str]) -> DataFrame:
     if df.width > len(new_columns):
         cols = df.columns
@@ -32,3 +108,124 @@ def _update_columns(df: DataFrame, new_columns: Sequence[str]) -> DataFrame:
         new_columns = cols
     df.columns = list(new_columns)
     return df
+
+
+def _check_autogenerated_column_names(
+    columns: Sequence[str] | None, *, has_header: bool
+) -> None:
+    """Check that `columns` refer to `column_x` names when there is no header."""
+    if columns and not has_header:
+        for column in columns:
+            if not column.startswith("column_"):
+                raise ValueError(
+                    "specified column names do not start with 'column_',"
+                    " but autogenerated header names were requested"
+                )
+
+
+def _normalize_dtypes(
+    projection: Sequence[int] | None,
+    columns: Sequence[str] | None,
+    new_columns: Sequence[str] | None,
+    dtypes: Mapping[str, PolarsDataType] | Sequence[PolarsDataType] | None,
+    *,
+    has_header: bool,
+) -> Mapping[str, PolarsDataType] | Sequence[PolarsDataType] | None:
+    """
+    Map user supplied `dtypes` onto the columns as seen by the CSV parser.
+
+    Used by `read_csv` and `read_csv_batched`, which both accept dtypes relative to
+    the selected (and possibly renamed) columns.
+    """
+    if not dtypes:
+        return dtypes
+
+    if projection and isinstance(dtypes, list):
+        if len(projection) < len(dtypes):
+            raise ValueError(
+                "more dtypes overrides are specified than there are selected columns"
+            )
+
+        # Fix list of dtypes when used together with projection as polars CSV reader
+        # wants a list of dtypes for the x first columns before it does the projection.
+        dtypes_list: list[PolarsDataType] = [Utf8] * (max(projection) + 1)
+
+        for idx, column_idx in enumerate(projection):
+            if idx < len(dtypes):
+                dtypes_list[column_idx] = dtypes[idx]
+
+        dtypes = dtypes_list
+
+    if columns and isinstance(dtypes, list):
+        if len(columns) < len(dtypes):
+            raise ValueError(
+                "more dtypes overrides are specified than there are selected columns"
+            )
+
+        # Map list of dtypes when used together with selected columns as a dtypes dict
+        # so the dtypes are applied to the correct column instead of the first x
+        # columns.
+        dtypes = dict(zip(columns, dtypes))
+
+    if new_columns and isinstance(dtypes, dict):
+        current_columns = None
+
+        # As new column names are not available yet while parsing the CSV file, rename
+        # column names in dtypes to old names (if possible) so they can be used during
+        # CSV parsing.
+        if columns:
+            if len(columns) < len(new_columns):
+                raise ValueError(
+                    "more new column names are specified than there are selected"
+                    " columns"
+                )
+
+            # Get column names of requested columns.
+            current_columns = columns[0 : len(new_columns)]
+        elif not has_header:
+            # When there are no header, column names are autogenerated (and known).
+
+            if projection:
+                # Convert column indices from projection to 'column_1', 'column_2', ...
+                # column names.
+                current_columns = _autogenerated_column_names(projection)
+            else:
+                # Generate autogenerated 'column_1', 'column_2', ... column names for
+                # new column names.
+                current_columns = _autogenerated_column_names(range(len(new_columns)))
+        else:
+            # When a header is present, column names are not known yet.
+
+            if len(dtypes) <= len(new_columns):
+                # If dtypes dictionary contains less or same amount of values than new
+                # column names a list of dtypes can be created if all listed column
+                # names in dtypes dictionary appear in the first consecutive new column
+                # names.
+                dtype_list = [
+                    dtypes[new_column_name]
+                    for new_column_name in new_columns[0 : len(dtypes)]
+                    if new_column_name in dtypes
+                ]
+
+                if len(dtype_list) == len(dtypes):
+                    dtypes = dtype_list
+
+        if current_columns and isinstance(dtypes, dict):
+            # Only new column names that have a dtype need to be mapped back.
+            new_to_current = {
+                new_column_name: current_column_name
+                for new_column_name, current_column_name in zip(
+                    new_columns, current_columns
+                )
+                if new_column_name in dtypes
+            }
+            if new_to_current:
+                # Change new column names to current column names in dtype. Build a
+                # new dict (rather than renaming keys in place) as the new and
+                # current names can overlap, e.g. when swapping two columns.
+                dtypes = {
+                    new_to_current.get(column_name, column_name): column_dtype
+                    for column_name, column_dtype in dtypes.items()
+                }
+
+    return dtypes
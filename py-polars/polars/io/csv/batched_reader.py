@@ -1,15 +1,15 @@
 from __future__ import annotations
 
 import contextlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, Sequence
+from typing import TYPE_CHECKING, Any, Sequence
 
 from polars.datatypes import N_INFER_DEFAULT, py_type_to_dtype
 from polars.io.csv._utils import _update_columns
 from polars.utils._wrap import wrap_df
 from polars.utils.various import (
     _prepare_row_count_args,
-    _process_null_values,
     handle_projection_columns,
     normalize_filepath,
 )
@@ -18,6 +18,8 @@ with contextlib.suppress(ImportError):  # Module not available when building doc
     from polars.polars import PyBatchedCsv
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
     from polars import DataFrame
     from polars.type_aliases import CsvEncoding, PolarsDataType, SchemaDict
 
@@ -55,6 +57,7 @@ class BatchedCsvReader:
         new_columns: Sequence[str] | None = None,
         raise_if_empty: bool = True,
         truncate_ragged_lines: bool = False,
+        prefetch_batches: int = 0,
     ):
         path: str | None
         if isinstance(source, (str, Path)):
@@ -72,7 +75,6 @@ class BatchedCsvReader:
             else:
                 raise TypeError("`dtypes` arg should be list or dict")
 
-        processed_null_values = _process_null_values(null_values)
         projection, columns = handle_projection_columns(columns)
 
         self._reader = PyBatchedCsv.new(
@@ -94,7 +96,7 @@ class BatchedCsvReader:
             low_memory=low_memory,
             comment_prefix=comment_prefix,
             quote_char=quote_char,
-            null_values=processed_null_values,
+            null_values=null_values,
             missing_utf8_is_empty_string=missing_utf8_is_empty_string,
             try_parse_dates=try_parse_dates,
             skip_rows_after_header=skip_rows_after_header,
@@ -106,6 +108,16 @@ class BatchedCsvReader:
         )
         self.new_columns = new_columns
 
+        # Batches are read ahead on a single background thread, so that parsing
+        # overlaps with the caller processing the previous batches.
+        self._prefetch_batches = prefetch_batches
+        self._prefetch_executor = (
+            ThreadPoolExecutor(max_workers=1) if prefetch_batches > 0 else None
+        )
+        self._prefetched: Future[Any] | None = None
+        self._buffered: list[Any] = []
+        self._exhausted = False
+
     def next_batches(self, n: int) -> list[DataFrame] | None:
         """
         Read `n` batches from the reader.
@@ -133,7 +145,10 @@ class BatchedCsvReader:
         list of DataFrames
 
         """
-        batches = self._reader.next_batches(n)
+        if self._prefetch_batches > 0:
+            batches = self._next_prefetched_batches(n)
+        else:
+            batches = self._reader.next_batches(n)
         if batches is not None:
             if self.new_columns:
                 return [
@@ -142,3 +157,37 @@ class BatchedCsvReader:
             else:
                 return [wrap_df(df) for df in batches]
         return None
+
+    def _next_prefetched_batches(self, n: int) -> list[Any] | None:
+        # The reader is only ever used by one thread at a time: wait for the
+        # batches that are being read ahead before reading any further.
+        if self._prefetched is not None:
+            prefetched = self._prefetched.result()
+            self._prefetched = None
+            if prefetched is None:
+                self._exhausted = True
+            else:
+                self._buffered.extend(prefetched)
+
+        if len(self._buffered) < n and not self._exhausted:
+            batches = self._reader.next_batches(n - len(self._buffered))
+            if batches is None:
+                self._exhausted = True
+            else:
+                self._buffered.extend(batches)
+
+        batches = self._buffered[:n]
+        del self._buffered[:n]
+
+        # top up the read-ahead buffer to at most `prefetch_batches` batches
+        n_prefetch = self._prefetch_batches - len(self._buffered)
+        if self._exhausted:
+            if self._prefetch_executor is not None:
+                # nothing is left to read ahead; release the worker thread
+                self._prefetch_executor.shutdown(wait=False)
+                self._prefetch_executor = None
+        elif n_prefetch > 0 and self._prefetch_executor is not None:
+            self._prefetched = self._prefetch_executor.submit(
+                self._reader.next_batches, n_prefetch
+            )
+        return batches or None
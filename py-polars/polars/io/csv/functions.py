@@ -1,12 +1,32 @@
 from __future__ import annotations
 
+from contextlib import nullcontext
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Mapping, Sequence, TextIO
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    ContextManager,
+    Mapping,
+    Sequence,
+    TextIO,
+)
 
 import polars._reexport as pl
-from polars.datatypes import N_INFER_DEFAULT, Utf8
+from polars.datatypes import N_INFER_DEFAULT
+from polars.dependencies import pyarrow as pa
 from polars.io._utils import _prepare_file_arg
-from polars.io.csv._utils import _check_arg_is_1byte, _update_columns
+from polars.io.csv._utils import (
+    _autogenerated_column_names,
+    _check_autogenerated_column_names,
+    _check_csv_separators,
+    _normalize_dtypes,
+    _pyarrow_column_names,
+    _pyarrow_csv,
+    _rename_prefix_fn,
+    _update_columns,
+)
 from polars.io.csv.batched_reader import BatchedCsvReader
 from polars.utils.deprecation import deprecate_renamed_parameter
 from polars.utils.various import handle_projection_columns, normalize_filepath
@@ -187,21 +207,20 @@ def read_csv(
     Set `rechunk=False` if you are benchmarking the csv-reader. A `rechunk` is
     an expensive operation.
 
+    With `encoding="utf8"` or `"utf8-lossy"` and `use_pyarrow=False`, local files
+    given as a path (`str` or `Path`) are memory-mapped by the reader, so their
+    contents are not copied into an intermediate buffer. Other encodings are
+    decoded in Python into an in-memory buffer first, and with `use_pyarrow=True`
+    pyarrow reads the file itself. Prefer passing a path over an open file handle
+    where possible.
+
     """
-    _check_arg_is_1byte("separator", separator, can_be_empty=False)
-    _check_arg_is_1byte("quote_char", quote_char, can_be_empty=True)
-    _check_arg_is_1byte("eol_char", eol_char, can_be_empty=False)
+    _check_csv_separators(separator, quote_char, eol_char)
 
     projection, columns = handle_projection_columns(columns)
     storage_options = storage_options or {}
 
-    if columns and not has_header:
-        for column in columns:
-            if not column.startswith("column_"):
-                raise ValueError(
-                    "specified column names do not start with 'column_',"
-                    " but autogenerated header names were requested"
-                )
+    _check_autogenerated_column_names(columns, has_header=has_header)
 
     if (
         use_pyarrow
@@ -216,14 +235,16 @@ def read_csv(
             if not has_header:
                 # Convert 'column_1', 'column_2', ... column names to 'f0', 'f1', ...
                 # column names for pyarrow, if CSV file does not contain a header.
-                include_columns = [f"f{int(column[7:]) - 1}" for column in columns]
+                include_columns = _pyarrow_column_names(
+                    int(column[7:]) - 1 for column in columns
+                )
             else:
                 include_columns = columns
 
         if not columns and projection:
             # Convert column indices from projection to 'f0', 'f1', ... column names
             # for pyarrow.
-            include_columns = [f"f{column_idx}" for column_idx in projection]
+            include_columns = _pyarrow_column_names(projection)
 
         with _prepare_file_arg(
             source,
@@ -232,23 +253,21 @@ def read_csv(
             raise_if_empty=raise_if_empty,
             **storage_options,
         ) as data:
-            import pyarrow as pa
-            import pyarrow.csv
-
+            pa_csv = _pyarrow_csv()
             try:
-                tbl = pa.csv.read_csv(
+                tbl = pa_csv.read_csv(
                     data,
-                    pa.csv.ReadOptions(
+                    pa_csv.ReadOptions(
                         skip_rows=skip_rows,
                         autogenerate_column_names=not has_header,
                         encoding=encoding,
                     ),
-                    pa.csv.ParseOptions(
+                    pa_csv.ParseOptions(
                         delimiter=separator,
                         quote_char=quote_char if quote_char else False,
                         double_quote=quote_char is not None and quote_char == '"',
                     ),
-                    pa.csv.ConvertOptions(
+                    pa_csv.ConvertOptions(
                         column_types=None,
                         include_columns=include_columns,
                         include_missing_columns=ignore_errors,
@@ -259,113 +278,43 @@ def read_csv(
                     raise
                 return pl.DataFrame()
 
+        column_names = tbl.column_names
         if not has_header:
             # Rename 'f0', 'f1', ... columns names autogenerated by pyarrow
             # to 'column_1', 'column_2', ...
-            tbl = tbl.rename_columns(
-                [f"column_{int(column[1:]) + 1}" for column in tbl.column_names]
+            column_names = _autogenerated_column_names(
+                int(column[1:]) for column in column_names
             )
+        if new_columns and len(new_columns) <= len(column_names):
+            # Apply the new column names in the same (single) rename of the table.
+            column_names[: len(new_columns)] = new_columns
+            new_columns = None
+        if column_names != tbl.column_names:
+            tbl = tbl.rename_columns(column_names)
 
         df = pl.DataFrame._from_arrow(tbl, rechunk=rechunk)
         if new_columns:
+            # more new column names than columns; let `_update_columns` raise
             return _update_columns(df, new_columns)
         return df
 
-    if projection and dtypes and isinstance(dtypes, list):
-        if len(projection) < len(dtypes):
-            raise ValueError(
-                "more dtypes overrides are specified than there are selected columns"
-            )
-
-        # Fix list of dtypes when used together with projection as polars CSV reader
-        # wants a list of dtypes for the x first columns before it does the projection.
-        dtypes_list: list[PolarsDataType] = [Utf8] * (max(projection) + 1)
-
-        for idx, column_idx in enumerate(projection):
-            if idx < len(dtypes):
-                dtypes_list[column_idx] = dtypes[idx]
-
-        dtypes = dtypes_list
-
-    if columns and dtypes and isinstance(dtypes, list):
-        if len(columns) < len(dtypes):
-            raise ValueError(
-                "more dtypes overrides are specified than there are selected columns"
-            )
-
-        # Map list of dtypes when used together with selected columns as a dtypes dict
-        # so the dtypes are applied to the correct column instead of the first x
-        # columns.
-        dtypes = dict(zip(columns, dtypes))
-
-    if new_columns and dtypes and isinstance(dtypes, dict):
-        current_columns = None
+    dtypes = _normalize_dtypes(
+        projection, columns, new_columns, dtypes, has_header=has_header
+    )
 
-        # As new column names are not available yet while parsing the CSV file, rename
-        # column names in dtypes to old names (if possible) so they can be used during
-        # CSV parsing.
-        if columns:
-            if len(columns) < len(new_columns):
-                raise ValueError(
-                    "more new column names are specified than there are selected"
-                    " columns"
-                )
+    if isinstance(source, bytes) and encoding in ("utf8", "utf8-lossy"):
+        # utf8 bytes can be handed to the parser as-is
+        source_ctx: ContextManager[Any] = nullcontext(source)
+    else:
+        source_ctx = _prepare_file_arg(
+            source,
+            encoding=encoding,
+            use_pyarrow=False,
+            raise_if_empty=raise_if_empty,
+            **storage_options,
+        )
 
-            # Get column names of requested columns.
-            current_columns = columns[0 : len(new_columns)]
-        elif not has_header:
-            # When there are no header, column names are autogenerated (and known).
-
-            if projection:
-                if columns and len(columns) < len(new_columns):
-                    raise ValueError(
-                        "more new column names are specified than there are selected"
-                        " columns"
-                    )
-                # Convert column indices from projection to 'column_1', 'column_2', ...
-                # column names.
-                current_columns = [
-                    f"column_{column_idx + 1}" for column_idx in projection
-                ]
-            else:
-                # Generate autogenerated 'column_1', 'column_2', ... column names for
-                # new column names.
-                current_columns = [
-                    f"column_{column_idx}"
-                    for column_idx in range(1, len(new_columns) + 1)
-                ]
-        else:
-            # When a header is present, column names are not known yet.
-
-            if len(dtypes) <= len(new_columns):
-                # If dtypes dictionary contains less or same amount of values than new
-                # column names a list of dtypes can be created if all listed column
-                # names in dtypes dictionary appear in the first consecutive new column
-                # names.
-                dtype_list = [
-                    dtypes[new_column_name]
-                    for new_column_name in new_columns[0 : len(dtypes)]
-                    if new_column_name in dtypes
-                ]
-
-                if len(dtype_list) == len(dtypes):
-                    dtypes = dtype_list
-
-        if current_columns and isinstance(dtypes, dict):
-            new_to_current = dict(zip(new_columns, current_columns))
-            # Change new column names to current column names in dtype.
-            dtypes = {
-                new_to_current.get(column_name, column_name): column_dtype
-                for column_name, column_dtype in dtypes.items()
-            }
-
-    with _prepare_file_arg(
-        source,
-        encoding=encoding,
-        use_pyarrow=False,
-        raise_if_empty=raise_if_empty,
-        **storage_options,
-    ) as data:
+    with source_ctx as data:
         df = pl.DataFrame._read_csv(
             data,
             has_header=has_header,
@@ -394,10 +343,8 @@ def read_csv(
             eol_char=eol_char,
             raise_if_empty=raise_if_empty,
             truncate_ragged_lines=truncate_ragged_lines,
+            new_columns=new_columns,
         )
-
-    if new_columns:
-        return _update_columns(df, new_columns)
     return df
 
 
@@ -432,6 +379,7 @@ def read_csv_batched(
     sample_size: int = 1024,
     eol_char: str = "\n",
     raise_if_empty: bool = True,
+    prefetch_batches: int = 0,
 ) -> BatchedCsvReader:
     r"""
     Read a CSV file in batches.
@@ -531,6 +479,10 @@ def read_csv_batched(
     raise_if_empty
         When there is no data in the source,`NoDataError` is raised. If this parameter
         is set to False, `None` will be returned from `next_batches(n)` instead.
+    prefetch_batches
+        Number of batches to read ahead on a background thread after every call to
+        `next_batches`, so that parsing overlaps with processing of the batches that
+        were returned. Set to 0 (default) to only read on request.
 
     Returns
     -------
@@ -576,99 +528,11 @@ def read_csv_batched(
     """
     projection, columns = handle_projection_columns(columns)
 
-    if columns and not has_header:
-        for column in columns:
-            if not column.startswith("column_"):
-                raise ValueError(
-                    "specified column names do not start with 'column_',"
-                    " but autogenerated header names were requested"
-                )
-
-    if projection and dtypes and isinstance(dtypes, list):
-        if len(projection) < len(dtypes):
-            raise ValueError(
-                "more dtypes overrides are specified than there are selected columns"
-            )
-
-        # Fix list of dtypes when used together with projection as polars CSV reader
-        # wants a list of dtypes for the x first columns before it does the projection.
-        dtypes_list: list[PolarsDataType] = [Utf8] * (max(projection) + 1)
-
-        for idx, column_idx in enumerate(projection):
-            if idx < len(dtypes):
-                dtypes_list[column_idx] = dtypes[idx]
-
-        dtypes = dtypes_list
+    _check_autogenerated_column_names(columns, has_header=has_header)
 
-    if columns and dtypes and isinstance(dtypes, list):
-        if len(columns) < len(dtypes):
-            raise ValueError(
-                "more dtypes overrides are specified than there are selected columns"
-            )
-
-        # Map list of dtypes when used together with selected columns as a dtypes dict
-        # so the dtypes are applied to the correct column instead of the first x
-        # columns.
-        dtypes = dict(zip(columns, dtypes))
-
-    if new_columns and dtypes and isinstance(dtypes, dict):
-        current_columns = None
-
-        # As new column names are not available yet while parsing the CSV file, rename
-        # column names in dtypes to old names (if possible) so they can be used during
-        # CSV parsing.
-        if columns:
-            if len(columns) < len(new_columns):
-                raise ValueError(
-                    "more new column names are specified than there are selected columns"
-                )
-
-            # Get column names of requested columns.
-            current_columns = columns[0 : len(new_columns)]
-        elif not has_header:
-            # When there are no header, column names are autogenerated (and known).
-
-            if projection:
-                if columns and len(columns) < len(new_columns):
-                    raise ValueError(
-                        "more new column names are specified than there are selected columns"
-                    )
-                # Convert column indices from projection to 'column_1', 'column_2', ...
-                # column names.
-                current_columns = [
-                    f"column_{column_idx + 1}" for column_idx in projection
-                ]
-            else:
-                # Generate autogenerated 'column_1', 'column_2', ... column names for
-                # new column names.
-                current_columns = [
-                    f"column_{column_idx}"
-                    for column_idx in range(1, len(new_columns) + 1)
-                ]
-        else:
-            # When a header is present, column names are not known yet.
-
-            if len(dtypes) <= len(new_columns):
-                # If dtypes dictionary contains less or same amount of values than new
-                # column names a list of dtypes can be created if all listed column
-                # names in dtypes dictionary appear in the first consecutive new column
-                # names.
-                dtype_list = [
-                    dtypes[new_column_name]
-                    for new_column_name in new_columns[0 : len(dtypes)]
-                    if new_column_name in dtypes
-                ]
-
-                if len(dtype_list) == len(dtypes):
-                    dtypes = dtype_list
-
-        if current_columns and isinstance(dtypes, dict):
-            new_to_current = dict(zip(new_columns, current_columns))
-            # Change new column names to current column names in dtype.
-            dtypes = {
-                new_to_current.get(column_name, column_name): column_dtype
-                for column_name, column_dtype in dtypes.items()
-            }
+    dtypes = _normalize_dtypes(
+        projection, columns, new_columns, dtypes, has_header=has_header
+    )
 
     return BatchedCsvReader(
         source,
@@ -697,6 +561,7 @@ def read_csv_batched(
         eol_char=eol_char,
         new_columns=new_columns,
         raise_if_empty=raise_if_empty,
+        prefetch_batches=prefetch_batches,
     )
 
 
@@ -902,14 +767,9 @@ def scan_csv(
             dtypes = dict(zip(new_columns, dtypes))
 
         # wrap new column names as a callable
-        def with_column_names(cols: list[str]) -> list[str]:
-            if len(cols) > len(new_columns):
-                return new_columns + cols[len(new_columns) :]  # type: ignore[operator]
-            else:
-                return new_columns  # type: ignore[return-value]
+        with_column_names = _rename_prefix_fn(tuple(new_columns))
 
-    _check_arg_is_1byte("separator", separator, can_be_empty=False)
-    _check_arg_is_1byte("quote_char", quote_char, can_be_empty=True)
+    _check_csv_separators(separator, quote_char, eol_char)
 
     if isinstance(source, (str, Path)):
         source = normalize_filepath(source)
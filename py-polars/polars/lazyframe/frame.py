@@ -71,7 +71,6 @@ from polars.utils.deprecation import (
 from polars.utils.various import (
     _in_notebook,
     _prepare_row_count_args,
-    _process_null_values,
     is_bool_sequence,
     is_sequence,
     normalize_filepath,
@@ -358,10 +357,7 @@ class LazyFrame:
         """
         dtype_list: list[tuple[str, PolarsDataType]] | None = None
         if dtypes is not None:
-            dtype_list = []
-            for k, v in dtypes.items():
-                dtype_list.append((k, py_type_to_dtype(v)))
-        processed_null_values = _process_null_values(null_values)
+            dtype_list = [(k, py_type_to_dtype(v)) for k, v in dtypes.items()]
 
         if isinstance(source, list):
             sources = source
@@ -383,7 +379,7 @@ class LazyFrame:
             low_memory,
             comment_prefix,
             quote_char,
-            processed_null_values,
+            null_values,
             missing_utf8_is_empty_string,
             infer_schema_length,
             with_column_names,
@@ -392,10 +388,10 @@ class LazyFrame:
             encoding,
             _prepare_row_count_args(row_count_name, row_count_offset),
             try_parse_dates,
-            eol_char=eol_char,
-            raise_if_empty=raise_if_empty,
-            truncate_ragged_lines=truncate_ragged_lines,
-            schema=schema,
+            eol_char,
+            raise_if_empty,
+            truncate_ragged_lines,
+            schema,
         )
         return self
 
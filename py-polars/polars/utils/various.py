@@ -48,15 +48,6 @@ if sys.version_info >= (3, 11):
     _reverse_mapping_views = tuple(type(reversed(view)) for view in _views)
 
 
-def _process_null_values(
-    null_values: None | str | Sequence[str] | dict[str, str] = None,
-) -> None | str | Sequence[str] | list[tuple[str, str]]:
-    if isinstance(null_values, dict):
-        return list(null_values.items())
-    else:
-        return null_values
-
-
 def _is_generator(val: object) -> bool:
     return (
         (isinstance(val, (Generator, Iterable)) and not isinstance(val, Sized))
@@ -168,14 +159,11 @@ def handle_projection_columns(
             )
         else:
             new_columns = columns
+        # `projection` holds the same values as `columns`, so one check covers both
         if columns and len(set(columns)) != len(columns):
             raise ValueError(
                 f"`columns` arg should only have unique values, got {columns!r}"
             )
-        if projection and len(set(projection)) != len(projection):
-            raise ValueError(
-                f"`columns` arg should only have unique values, got {projection!r}"
-            )
     return projection, new_columns
 
 
@@ -226,11 +214,8 @@ def normalize_filepath(path: str | Path, *, check_not_directory: bool = True) ->
     """Create a string path, expanding the home directory if present."""
     # don't use pathlib here as it modifies slashes (s3:// -> s3:/)
     path = os.path.expanduser(path)  # noqa: PTH111
-    if (
-        check_not_directory
-        and os.path.exists(path)  # noqa: PTH110
-        and os.path.isdir(path)  # noqa: PTH112
-    ):
+    # `isdir` is False for paths that do not exist, saving a separate `exists` stat
+    if check_not_directory and os.path.isdir(path):  # noqa: PTH112
         raise IsADirectoryError(f"expected a file path; {path!r} is a directory")
     return path
 
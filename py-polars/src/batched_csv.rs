@@ -135,12 +135,14 @@ impl PyBatchedCsv {
         Ok(PyBatchedCsv { reader })
     }
 
-    fn next_batches(&mut self, n: usize) -> PyResult<Option<Vec<PyDataFrame>>> {
-        let batches = match &mut self.reader {
-            BatchedReader::MMap(reader) => reader.next_batches(n),
-            BatchedReader::Read(reader) => reader.next_batches(n),
-        }
-        .map_err(PyPolarsErr::from)?;
+    fn next_batches(&mut self, py: Python, n: usize) -> PyResult<Option<Vec<PyDataFrame>>> {
+        let reader = &mut self.reader;
+        let batches = py
+            .allow_threads(move || match reader {
+                BatchedReader::MMap(reader) => reader.next_batches(n),
+                BatchedReader::Read(reader) => reader.next_batches(n),
+            })
+            .map_err(PyPolarsErr::from)?;
 
         // safety: same memory layout
         let batches = unsafe {
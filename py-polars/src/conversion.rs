@@ -161,6 +161,13 @@ impl<'a> FromPyObject<'a> for Wrap<NullValues> {
     fn extract(ob: &'a PyAny) -> PyResult<Self> {
         if let Ok(s) = ob.extract::<String>() {
             Ok(Wrap(NullValues::AllColumnsSingle(s)))
+        } else if let Ok(d) = ob.downcast::<PyDict>() {
+            // iterate the dict directly; the size is known so the vec is allocated once
+            let mut named = Vec::with_capacity(d.len());
+            for (k, v) in d {
+                named.push((k.extract::<String>()?, v.extract::<String>()?));
+            }
+            Ok(Wrap(NullValues::Named(named)))
         } else if let Ok(s) = ob.extract::<Vec<String>>() {
             Ok(Wrap(NullValues::AllColumns(s)))
         } else if let Ok(s) = ob.extract::<Vec<(String, String)>>() {
@@ -175,9 +175,11 @@ impl PyDataFrame {
         skip_rows, projection, separator, rechunk, columns, encoding, n_threads, path,
         overwrite_dtype, overwrite_dtype_slice, low_memory, comment_prefix, quote_char,
         null_values, missing_utf8_is_empty_string, try_parse_dates, skip_rows_after_header,
-        row_count, sample_size, eol_char, raise_if_empty, truncate_ragged_lines, schema)
+        row_count, sample_size, eol_char, raise_if_empty, truncate_ragged_lines, schema,
+        new_columns=None)
     )]
     pub fn read_csv(
+        py: Python,
         py_f: &PyAny,
         infer_schema_length: Option<usize>,
         chunk_size: usize,
@@ -207,6 +209,7 @@ impl PyDataFrame {
         raise_if_empty: bool,
         truncate_ragged_lines: bool,
         schema: Option<Wrap<Schema>>,
+        new_columns: Option<Vec<String>>,
     ) -> PyResult<Self> {
         let null_values = null_values.map(|w| w.0);
         let eol_char = eol_char.as_bytes()[0];
@@ -231,37 +234,53 @@ impl PyDataFrame {
         });
 
         let mmap_bytes_r = get_mmap_bytes_reader(py_f)?;
-        let df = CsvReader::new(mmap_bytes_r)
-            .infer_schema(infer_schema_length)
-            .has_header(has_header)
-            .with_n_rows(n_rows)
-            .with_separator(separator.as_bytes()[0])
-            .with_skip_rows(skip_rows)
-            .with_ignore_errors(ignore_errors)
-            .with_projection(projection)
-            .with_rechunk(rechunk)
-            .with_chunk_size(chunk_size)
-            .with_encoding(encoding.0)
-            .with_columns(columns)
-            .with_n_threads(n_threads)
-            .with_path(path)
-            .with_dtypes(overwrite_dtype.map(Arc::new))
-            .with_dtypes_slice(overwrite_dtype_slice.as_deref())
-            .with_schema(schema.map(|schema| Arc::new(schema.0)))
-            .low_memory(low_memory)
-            .with_null_values(null_values)
-            .with_missing_is_null(!missing_utf8_is_empty_string)
-            .with_comment_prefix(comment_prefix)
-            .with_try_parse_dates(try_parse_dates)
-            .with_quote_char(quote_char)
-            .with_end_of_line_char(eol_char)
-            .with_skip_rows_after_header(skip_rows_after_header)
-            .with_row_count(row_count)
-            .sample_size(sample_size)
-            .raise_if_empty(raise_if_empty)
-            .truncate_ragged_lines(truncate_ragged_lines)
-            .finish()
-            .map_err(PyPolarsErr::from)?;
+        let df = py.allow_threads(move || {
+            CsvReader::new(mmap_bytes_r)
+                .infer_schema(infer_schema_length)
+                .has_header(has_header)
+                .with_n_rows(n_rows)
+                .with_separator(separator.as_bytes()[0])
+                .with_skip_rows(skip_rows)
+                .with_ignore_errors(ignore_errors)
+                .with_projection(projection)
+                .with_rechunk(rechunk)
+                .with_chunk_size(chunk_size)
+                .with_encoding(encoding.0)
+                .with_columns(columns)
+                .with_n_threads(n_threads)
+                .with_path(path)
+                .with_dtypes(overwrite_dtype.map(Arc::new))
+                .with_dtypes_slice(overwrite_dtype_slice.as_deref())
+                .with_schema(schema.map(|schema| Arc::new(schema.0)))
+                .low_memory(low_memory)
+                .with_null_values(null_values)
+                .with_missing_is_null(!missing_utf8_is_empty_string)
+                .with_comment_prefix(comment_prefix)
+                .with_try_parse_dates(try_parse_dates)
+                .with_quote_char(quote_char)
+                .with_end_of_line_char(eol_char)
+                .with_skip_rows_after_header(skip_rows_after_header)
+                .with_row_count(row_count)
+                .sample_size(sample_size)
+                .raise_if_empty(raise_if_empty)
+                .truncate_ragged_lines(truncate_ragged_lines)
+                .finish()
+                .and_then(|mut df| {
+                    if let Some(mut new_columns) = new_columns {
+                        // Columns beyond the given names keep their original name.
+                        let n_new = new_columns.len();
+                        new_columns.extend(
+                            df.get_column_names()
+                                .into_iter()
+                                .skip(n_new)
+                                .map(String::from),
+                        );
+                        df.set_column_names(&new_columns)?;
+                    }
+                    Ok(df)
+                })
+                .map_err(PyPolarsErr::from)
+        })?;
         Ok(df.into())
     }
 
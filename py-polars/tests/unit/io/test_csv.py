@@ -376,6 +376,20 @@ def test_read_csv_columns_argument(
     assert df.columns == col_out
 
 
+def test_read_csv_unselected_columns_are_not_parsed() -> None:
+    csv = textwrap.dedent(
+        """\
+        a,b,c
+        1,x,3
+        2,y,4
+        """
+    )
+    # "b" cannot be parsed as an integer, but as it is not selected its values
+    # should never reach the value parser
+    df = pl.read_csv(io.StringIO(csv), columns=["a", "c"], dtypes={"b": pl.Int64})
+    assert df.to_dict(as_series=False) == {"a": [1, 2], "c": [3, 4]}
+
+
 def test_read_csv_buffer_ownership() -> None:
     bts = b"\xf0\x9f\x98\x80,5.55,333\n\xf0\x9f\x98\x86,-5.0,666"
     buf = io.BytesIO(bts)
@@ -446,6 +460,16 @@ def test_column_rename_and_dtype_overwrite() -> None:
     )
     assert df.dtypes == [pl.Utf8, pl.Float32]
 
+    # new column names that swap existing names
+    f = io.StringIO(csv)
+    df = pl.read_csv(
+        f,
+        columns=["a", "b"],
+        new_columns=["b", "a"],
+        dtypes={"b": pl.Utf8, "a": pl.Float32},
+    )
+    assert df.schema == {"b": pl.Utf8, "a": pl.Float32}
+
     csv = textwrap.dedent(
         """\
         1,2,3
@@ -1178,6 +1202,19 @@ def test_float_precision(dtype: pl.Float32 | pl.Float64) -> None:
     assert df.write_csv(float_precision=3) == "col\n1.000\n2.200\n3.330\n"
 
 
+def test_read_csv_float32_is_parsed_directly() -> None:
+    # This value rounds to the exact midpoint between two float32 values when
+    # parsed as float64 first (and that midpoint then rounds down to 1.0), so only
+    # parsing straight into float32 gives the correctly rounded value.
+    csv = "x\n1.0000000596046447755\n"
+    for df in (
+        pl.read_csv(io.StringIO(csv), dtypes={"x": pl.Float32}),
+        pl.read_csv(io.StringIO(csv), dtypes=[pl.Float32]),
+    ):
+        assert df.dtypes == [pl.Float32]
+        assert df["x"].item() == 1.0 + 2**-23
+
+
 def test_skip_rows_different_field_len() -> None:
     csv = io.StringIO(
         textwrap.dedent(
@@ -1308,6 +1345,20 @@ def test_batched_csv_reader_all_batches(foods_file_path: Path) -> None:
         assert_frame_equal(out, batched_concat_df)
 
 
+def test_batched_csv_reader_prefetch(foods_file_path: Path) -> None:
+    out = pl.read_csv(foods_file_path)
+    for n_batches in (1, 3, 5):
+        reader = pl.read_csv_batched(foods_file_path, batch_size=4, prefetch_batches=2)
+        batched_dfs = []
+        while batches := reader.next_batches(n_batches):
+            assert len(batches) <= n_batches
+            batched_dfs.extend(batches)
+        assert_frame_equal(out, pl.concat(batched_dfs, rechunk=True))
+        assert reader.next_batches(n_batches) is None
+        # the read-ahead worker is released once the file is exhausted
+        assert reader._prefetch_executor is None
+
+
 def test_batched_csv_reader_no_batches(foods_file_path: Path) -> None:
     reader = pl.read_csv_batched(foods_file_path, batch_size=4)
     batches = reader.next_batches(0)
@@ -1710,3 +1761,14 @@ def test_csv_no_new_line_last() -> None:
         "a": [1, 2, 3],
         "b": [1.0, 2.0, 2.1],
     }
+
+
+def test_read_csv_parallel_chunks_with_quoted_fields() -> None:
+    # large enough to be split into chunks that are parsed in parallel; quoted
+    # fields must be split the same way in every chunk
+    n = 10_000
+    text = "a,b,c\n" + '1,"x, ""y"", z",2\n' * n
+    df = pl.read_csv(text.encode())
+    assert df.shape == (n, 3)
+    assert df["b"].unique().to_list() == ['x, "y", z']
+    assert df["c"].sum() == 2 * n
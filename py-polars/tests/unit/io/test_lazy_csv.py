@@ -285,3 +285,30 @@ def test_scan_empty_csv_with_row_count(tmp_path: Path) -> None:
 
     read = pl.scan_csv(file_path).with_row_count("idx")
     assert read.collect().schema == OrderedDict([("idx", pl.UInt32), ("a", pl.Utf8)])
+
+
+def test_scan_csv_invalid_separators(io_files_path: Path) -> None:
+    path = io_files_path / "small.csv"
+    with pytest.raises(ValueError, match=r'separator=";;" should be a single byte'):
+        pl.scan_csv(path, separator=";;")
+    with pytest.raises(ValueError, match=r'quote_char="ab" should be a single byte'):
+        pl.scan_csv(path, quote_char="ab")
+    with pytest.raises(ValueError, match=r'eol_char="" should be a single byte'):
+        pl.scan_csv(path, eol_char="")
+
+
+def test_scan_csv_projection_and_predicate_pushdown(foods_file_path: Path) -> None:
+    lf = (
+        pl.scan_csv(foods_file_path)
+        .select(["category", "calories"])
+        .filter(pl.col("calories") > 100)
+    )
+    # only the selected columns are parsed and the filter is applied in the scan
+    plan = lf.explain()
+    assert "PROJECT 2/4 COLUMNS" in plan
+    assert 'SELECTION: [(col("calories")) > (100)]' in plan
+
+    expected = pl.read_csv(foods_file_path, columns=["category", "calories"]).filter(
+        pl.col("calories") > 100
+    )
+    assert_frame_equal(lf.collect(), expected)